@@ -4,6 +4,13 @@ import numpy as np
 MU_0 = 4 * np.pi * 1e-7      # Permeabilidade do vácuo (H/m)
 EPSILON_0 = 8.85e-12         # Permissividade do vácuo (F/m)
 K_0 = 1 / (2 * np.pi * EPSILON_0)  # Fator para cálculos capacitivos (m/F)
-w = 2*np.pi*60          # Frequência angular (rad/s)
+f = 60                  #Frequencia 
+w = 2*np.pi*f           # Frequência angular (rad/s)
 g = 1.7811              #Euler's constante
-f = 60                  #Frequencia 
\ No newline at end of file
+
+# Fatores de Carson (dependem apenas da frequência)
+def fatores_carson(w):
+    # Resistência de retorno pelo solo e fator da reatância indutiva (Ohm/m)
+    return MU_0 * w / 8, MU_0 * w / (2 * np.pi)
+
+R_CARSON, X_CARSON = fatores_carson(w)
@@ -1,10 +1,19 @@
+import cmath
+import math
+import sys
 import numpy as np
 import constants
 
+def _fator_penetracao(w, resistividade):
+    return np.sqrt(w * constants.MU_0 / resistividade)
+
 class solo:
     def __init__(self,resistividade):
         self.resistividade = resistividade
 
+    def calcular_fator_penetracao(self):
+        return _fator_penetracao(constants.w, self.resistividade)
+
 class coordenadas:
     def __init__(self, x, y):
         self.x = x
@@ -20,22 +29,67 @@ class linha_transmissao:
         self.cabos = cabos
         self.solo = solo
 
+    def _array_cabos(self):
+        # Coordenadas e correntes (fasores) de todos os cabos em um único array estruturado (N,).
+        # Reconstruído a cada chamada para refletir alterações feitas nos objetos cabo.
+        return np.array([(c.coordenadas.x, c.coordenadas.y, c.corrente) for c in self.cabos],
+                        dtype=[('x', 'f8'), ('y', 'f8'), ('I', 'c16')])
+
+    def _distancias(self, cabos, duto):
+        return np.hypot(cabos['x'] - duto.coordenadas.x, cabos['y'] - duto.coordenadas.y)
+
     def calcular_distancia_duto(self, duto):
-        distancias = []
-        for cabo in self.cabos:
-            dist = np.sqrt((cabo.coordenadas.x - duto.coordenadas.x)**2 + (cabo.coordenadas.y - duto.coordenadas.y)**2)
-            distancias.append(dist)
-        return distancias
-
-    def calcular_impedancia_mutua(self, duto):
-        impedancias_mutuas = []
-        for i, cabo in enumerate(self.cabos):
-            dist = self.calcular_distancia_duto(duto)[i]
-            # Carson-Clem formula
-            real = (constants.MU_0 * constants.w / 8)
-            imaginario = (constants.MU_0 * constants.w / (2 * np.pi)) * np.log(1 / (dist * np.sqrt(constants.w * constants.MU_0 / self.solo.resistividade)))
-            impedancias_mutuas.append(real + 1j * imaginario)
-        return impedancias_mutuas
+        return self._distancias(self._array_cabos(), duto)
+
+    def _coeficientes_carson(self, frequencia=None):
+        # Coeficientes (R, X, k) de Carson-Clem; sem frequência explícita usa R e X pré-calculados.
+        # k é sempre calculado da resistividade atual do solo.
+        if frequencia is None:
+            return constants.R_CARSON, constants.X_CARSON, self.solo.calcular_fator_penetracao()
+        # Frequência e resistividade formam uma grade externa: k tem forma frequencia.shape + resistividade.shape
+        resistividade = np.asarray(self.solo.resistividade, dtype=float)
+        w = 2 * np.pi * np.asarray(frequencia, dtype=float)
+        w = w.reshape(w.shape + (1,) * resistividade.ndim)
+        return (*constants.fatores_carson(w), _fator_penetracao(w, resistividade))
+
+    def _impedancia_carson_clem(self, dist, frequencia=None):
+        # Carson-Clem formula; resultado com forma dist.shape + k.shape (cabos sempre no eixo 0 de dist)
+        real, fator_x, k = self._coeficientes_carson(frequencia)
+        imaginario = fator_x * (-np.log(np.multiply.outer(dist, k)))
+        return real + 1j * imaginario
+
+    def _somar_contribuicoes(self, cabos, impedancias_mutuas):
+        # Soma I*Z sobre o eixo dos cabos (eixo 0), preservando os demais eixos
+        return np.tensordot(cabos['I'], impedancias_mutuas, axes=(0, 0))[()]
+
+    def calcular_impedancia_mutua(self, duto, frequencia=None):
+        return self._impedancia_carson_clem(self.calcular_distancia_duto(duto), frequencia)
+
+    def calcular_perfil_tensao_induzida(self, duto, posicoes_x):
+        # Varredura da posição horizontal do duto (na profundidade do duto): distâncias
+        # com forma (N,) + posicoes_x.shape em um único broadcast
+        cabos = self._array_cabos()
+        posicoes_x = np.asarray(posicoes_x, dtype=float)
+        dist = np.hypot(np.subtract.outer(cabos['x'], posicoes_x),
+                        np.subtract.outer(cabos['y'], np.full_like(posicoes_x, duto.coordenadas.y)))
+        return self._somar_contribuicoes(cabos, self._impedancia_carson_clem(dist))
+
+    def compilar_para(self, duto):
+        # Especializa o cálculo para geometria fixa: V = R*sum(I) - 1j*X*(I.log(d) + log(k)*sum(I))
+        # A geometria e as correntes são capturadas no momento da chamada
+        cabos = self._array_cabos()
+        soma_correntes = cabos['I'].sum()
+        soma_log_dist = cabos['I'] @ np.log(self._distancias(cabos, duto))
+
+        def tensao_induzida(resistividade, frequencia=constants.f):
+            # Aceita escalares ou arrays: varreduras em resistividade/frequência são feitas por broadcast
+            w = 2 * np.pi * np.asarray(frequencia, dtype=float)
+            real, fator_x = constants.fatores_carson(w)
+            log_k = np.log(_fator_penetracao(w, np.asarray(resistividade, dtype=float)))
+            imaginario = fator_x * (soma_log_dist + log_k * soma_correntes)
+            return real * soma_correntes - 1j * imaginario
+
+        return tensao_induzida
 
 class duto:
 
@@ -57,8 +111,8 @@ class duto:
         
     def calcular_impdancia_propria(self):
         a = np.sqrt(self.resistividade * self.permeabilidade * constants.MU_0 * constants.w) / (np.pi * self.diametro * np.sqrt(2))
-        r_duto = a + constants.MU_0 * constants.w/8
-        imaginario_duto = a + (constants.MU_0 * constants.w / (2*np.pi)) * np.log(3.7 * np.sqrt(self.resistividade * (constants.w**-1)*(constants.MU_0**-1) )/ self.diametro)
+        r_duto = a + constants.R_CARSON
+        imaginario_duto = a + constants.X_CARSON * np.log(3.7 * np.sqrt(self.resistividade / (constants.w * constants.MU_0)) / self.diametro)
         return r_duto + 1j * imaginario_duto
     
     def calcular_adimetancia(self):
@@ -75,47 +129,54 @@ class duto:
     def calcular_comprimento_caracteristico(self):
         return 1/ self.constante_propagacao.real
 
-    def calcular_tensao_induzida(self, lt):
-        tensao_total_induzida = 0
-        impedancias_mutuas = lt.calcular_impedancia_mutua(self)
-        for i, cabo in enumerate(lt.cabos):
-            tensao_total_induzida += impedancias_mutuas[i] * cabo.corrente
-        return tensao_total_induzida
+    def calcular_tensao_induzida(self, lt, impedancias_mutuas=None, frequencia=None):
+        if impedancias_mutuas is not None and frequencia is not None:
+            raise ValueError("Informe impedancias_mutuas ou frequencia, não ambos")
+        cabos = lt._array_cabos()
+        if impedancias_mutuas is None:
+            impedancias_mutuas = lt._impedancia_carson_clem(lt._distancias(cabos, self), frequencia)
+        return lt._somar_contribuicoes(cabos, impedancias_mutuas)
     
     def imprimir_caracteristicas(self, lt):
-        print("\n--- Características do Duto ---")
-        print(f"Diâmetro: {self.diametro:.4f} m")
-        print(f"Espessura da Cobertura: {self.espessura_cobertura:.4f} m")
-        print(f"Resistividade do Duto: {self.resistividade:.2e} Ohm/m")
-        print(f"Permeabilidade do Duto: {self.permeabilidade}")
-        print(f"Permeabilidade da Cobertura: {self.permeabilidade_cobertura:.2e}")
-        print(f"Permissividade Relativa (EPSILON): {self.EPSILON}")
-        print(f"Resistividade do Solo: {lt.solo.resistividade:.2e} Ohm.m")
-        print(f"Resistência da Cobertura (verificar fórmula): {self.resistencia_cobertura:.4f} Ohm (possivelmente)")
-        print(f"")
-        print(f"Impedância Própria (Zp): {self.impedancia_propria:.4e} Ohm")
-        print(f"  (Real: {self.impedancia_propria.real:.4e}, Imaginária: {self.impedancia_propria.imag:.4e})")
-        print(f"Admitância (Y): {self.adimitancia:.4e} Siemens")
-        print(f"  (Real: {self.adimitancia.real:.4e}, Imaginária: {self.adimitancia.imag:.4e})")
-        print(f"")
-        print(f"Impedância Característica (Zc): {self.impedancia_caracteristica:.4e} Ohm")
-        print(f"  (Magnitude: {np.abs(self.impedancia_caracteristica):.4e}, Ângulo: {np.degrees(np.angle(self.impedancia_caracteristica)):.2f}°)")
-        print(f"Constante de Propagação (gamma): {self.constante_propagacao:.4e} 1/m")
-        print(f"  (Alpha (Atenuação): {self.constante_propagacao.real:.4e}, Beta (Fase): {self.constante_propagacao.imag:.4e})")
-        print(f"Comprimento Característico (1/Alpha): {self.comprimento_caracteristico:.4f} m")
-        print("-----------------------------\n")
+        linhas = []
+        linhas.append("\n--- Características do Duto ---")
+        linhas.append(f"Diâmetro: {self.diametro:.4f} m")
+        linhas.append(f"Espessura da Cobertura: {self.espessura_cobertura:.4f} m")
+        linhas.append(f"Resistividade do Duto: {self.resistividade:.2e} Ohm/m")
+        linhas.append(f"Permeabilidade do Duto: {self.permeabilidade}")
+        linhas.append(f"Permeabilidade da Cobertura: {self.permeabilidade_cobertura:.2e}")
+        linhas.append(f"Permissividade Relativa (EPSILON): {self.EPSILON}")
+        linhas.append(f"Resistividade do Solo: {lt.solo.resistividade:.2e} Ohm.m")
+        linhas.append(f"Resistência da Cobertura (verificar fórmula): {self.resistencia_cobertura:.4f} Ohm (possivelmente)")
+        linhas.append(f"")
+        linhas.append(f"Impedância Própria (Zp): {self.impedancia_propria:.4e} Ohm")
+        linhas.append(f"  (Real: {self.impedancia_propria.real:.4e}, Imaginária: {self.impedancia_propria.imag:.4e})")
+        linhas.append(f"Admitância (Y): {self.adimitancia:.4e} Siemens")
+        linhas.append(f"  (Real: {self.adimitancia.real:.4e}, Imaginária: {self.adimitancia.imag:.4e})")
+        linhas.append(f"")
+        modulo_zc, fase_zc = cmath.polar(self.impedancia_caracteristica)
+        linhas.append(f"Impedância Característica (Zc): {self.impedancia_caracteristica:.4e} Ohm")
+        linhas.append(f"  (Magnitude: {modulo_zc:.4e}, Ângulo: {math.degrees(fase_zc):.2f}°)")
+        linhas.append(f"Constante de Propagação (gamma): {self.constante_propagacao:.4e} 1/m")
+        linhas.append(f"  (Alpha (Atenuação): {self.constante_propagacao.real:.4e}, Beta (Fase): {self.constante_propagacao.imag:.4e})")
+        linhas.append(f"Comprimento Característico (1/Alpha): {self.comprimento_caracteristico:.4f} m")
+        linhas.append("-----------------------------\n")
 
         # Calcular e imprimir impedâncias mútuas
-        impedancias_mutuas = lt.calcular_impedancia_mutua(self)
-        print("\n--- Impedâncias Mútuas (Duto-Cabos) ---")
+        cabos = lt._array_cabos()
+        impedancias_mutuas = lt._impedancia_carson_clem(lt._distancias(cabos, self))
+        linhas.append("\n--- Impedâncias Mútuas (Duto-Cabos) ---")
         for i, zm in enumerate(impedancias_mutuas):
-            print(f"Impedância Mútua com Cabo {i+1}: {zm:.4e} Ohm/m")
-            print(f"  (Real: {zm.real:.4e}, Imaginária: {zm.imag:.4e})")
-        print("----------------------------------------\n")
+            linhas.append(f"Impedância Mútua com Cabo {i+1}: {zm:.4e} Ohm/m")
+            linhas.append(f"  (Real: {zm.real:.4e}, Imaginária: {zm.imag:.4e})")
+        linhas.append("----------------------------------------\n")
 
         # Calcular e imprimir tensão induzida
-        tensao_induzida = self.calcular_tensao_induzida(lt)
-        print("\n--- Tensão Induzida no Duto ---")
-        print(f"Tensão Induzida Total: {tensao_induzida:.4e} V/m")
-        print(f"  (Magnitude: {np.abs(tensao_induzida):.4e}, Ângulo: {np.degrees(np.angle(tensao_induzida)):.2f}°)")
-        print("---------------------------------\n")
\ No newline at end of file
+        tensao_induzida = lt._somar_contribuicoes(cabos, impedancias_mutuas)
+        linhas.append("\n--- Tensão Induzida no Duto ---")
+        modulo_tensao, fase_tensao = cmath.polar(tensao_induzida)
+        linhas.append(f"Tensão Induzida Total: {tensao_induzida:.4e} V/m")
+        linhas.append(f"  (Magnitude: {modulo_tensao:.4e}, Ângulo: {math.degrees(fase_tensao):.2f}°)")
+        linhas.append("---------------------------------\n")
+
+        sys.stdout.write("\n".join(linhas) + "\n")
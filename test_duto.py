@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from duto import solo, duto, coordenadas, cabo, linha_transmissao
+
+
+def _montar(resistividade):
+    solo1 = solo(resistividade=resistividade)
+    cabos = [
+        cabo(coordenadas=coordenadas(x=10, y=20), corrente=100),
+        cabo(coordenadas=coordenadas(x=15, y=25), corrente=150 * np.exp(-2j * np.pi / 3)),
+        cabo(coordenadas=coordenadas(x=20, y=30), corrente=200 * np.exp(2j * np.pi / 3)),
+    ]
+    lt = linha_transmissao(cabos=cabos, solo=solo1)
+    duto1 = duto(diametro=0.3, solo=solo(100), espessura_cobertura=0.003, coordenadas=coordenadas(x=0, y=-2))
+    return lt, duto1
+
+
+SOLOS = [100.0, np.array([10.0, 100.0, 1000.0])]
+
+
+@pytest.mark.parametrize("resistividade", SOLOS)
+def test_perfil_igual_a_tensao_induzida_ponto_a_ponto(resistividade):
+    lt, duto1 = _montar(resistividade)
+    posicoes_x = np.array([-40.0, 0.0, 12.5, 60.0])
+    perfil = lt.calcular_perfil_tensao_induzida(duto1, posicoes_x)
+    for i, x in enumerate(posicoes_x):
+        duto1.coordenadas.x = x
+        np.testing.assert_allclose(perfil[i], duto1.calcular_tensao_induzida(lt))
+    np.testing.assert_allclose(lt.calcular_perfil_tensao_induzida(duto1, 60.0), perfil[-1])
+
+
+@pytest.mark.parametrize("resistividade", SOLOS)
+def test_compilar_para_igual_a_tensao_induzida(resistividade):
+    lt, duto1 = _montar(resistividade)
+    tensao = lt.compilar_para(duto1)
+    np.testing.assert_allclose(tensao(resistividade), duto1.calcular_tensao_induzida(lt))
+
+
+@pytest.mark.parametrize("resistividade", SOLOS)
+def test_frequencia_explicita(resistividade):
+    lt, duto1 = _montar(resistividade)
+    np.testing.assert_allclose(duto1.calcular_tensao_induzida(lt, frequencia=60),
+                               duto1.calcular_tensao_induzida(lt))
+
+    frequencias = np.array([50.0, 60.0, 180.0])
+    tensoes = duto1.calcular_tensao_induzida(lt, frequencia=frequencias)
+    tensao = lt.compilar_para(duto1)
+    for i, f in enumerate(frequencias):
+        np.testing.assert_allclose(tensoes[i], tensao(resistividade, f))
+
+
+def test_alteracoes_em_cabos_e_solo_sao_refletidas():
+    lt, duto1 = _montar(100.0)
+    lt.cabos[0].corrente = 0
+    lt.solo.resistividade = 1000.0
+    np.testing.assert_allclose(duto1.calcular_tensao_induzida(lt), lt.compilar_para(duto1)(1000.0))